@@ -10,11 +10,55 @@ import asyncio
 import os
 import time
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
+from collections import OrderedDict
 from dataclasses import dataclass
 
 from dotenv import load_dotenv
 import json
+import httpx
+
+try:
+    import orjson
+
+    def _json_loads(content: Any) -> Any:
+        if isinstance(content, str):
+            content = content.encode()
+        return orjson.loads(content)
+except ImportError:  # pragma: no cover - stdlib fallback
+    _json_loads = json.loads
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - plain-list fallback
+    np = None
+
+try:
+    import msgspec
+
+    class _OptionU64Msg(msgspec.Struct):
+        """Aptos Option<u64> JSON encoding: {"vec": []} or {"vec": ["n"]}"""
+        vec: List[str] = []
+
+    class _RaceStateViewMsg(msgspec.Struct):
+        """Typed subset of RaceStateView; unused fields are skipped by the
+        decoder instead of being materialized as Python objects"""
+        race_id: str
+        creator: str
+        race_type: int
+        race_started: bool
+        race_finished: bool
+        current_round: str
+        entries: List[Any]
+        start_time: _OptionU64Msg
+
+    # View responses are a JSON array of return values; these views return
+    # a single vector, hence the outer List
+    _STATES_DECODER = msgspec.json.Decoder(List[List[_RaceStateViewMsg]])
+    _ACTIVE_IDS_DECODER = msgspec.json.Decoder(List[List[str]])
+except ImportError:  # pragma: no cover - generic JSON fallback
+    _STATES_DECODER = None
+    _ACTIVE_IDS_DECODER = None
 from aptos_sdk.async_client import RestClient, ClientConfig, ApiError
 from aptos_sdk.account import Account
 from aptos_sdk.transactions import EntryFunction, TransactionPayload, TransactionArgument
@@ -33,6 +77,10 @@ NODE_URL = os.getenv("NODE_URL", DEFAULT_NODE_URL)
 CONTRACT_ADDRESS = os.getenv("CONTRACT_ADDRESS", DEFAULT_CONTRACT_ADDRESS)
 BOT_CHECK_INTERVAL = int(os.getenv("BOT_CHECK_INTERVAL", "5"))  # seconds
 RACE_ADVANCE_COOLDOWN = int(os.getenv("RACE_ADVANCE_COOLDOWN", "8"))  # seconds
+BOT_MAX_CHECK_INTERVAL = int(os.getenv("BOT_MAX_CHECK_INTERVAL", "30"))  # seconds
+BOT_WORKERS = int(os.getenv("BOT_WORKERS", "4"))  # race-processing worker coroutines
+VIEW_CACHE_TTL = float(os.getenv("VIEW_CACHE_TTL", str(BOT_CHECK_INTERVAL * 2)))  # seconds
+PAYLOAD_CACHE_MAX = 4096  # (race_id, function) payloads kept for reuse
 MODULE_NAME = "equinox_v3"
 
 # Setup logging
@@ -47,9 +95,35 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+class PooledRestClient(RestClient):
+    """RestClient backed by a tuned keep-alive httpx pool.
+
+    Every view/submit is a separate HTTPS request; without an explicit
+    keep-alive pool each one can pay TCP+TLS setup on testnet. Swap the
+    SDK's default httpx client for one with generous keep-alive limits so
+    connections are reused across the whole bot lifetime.
+    """
+
+    def __init__(self, base_url: str, client_config: ClientConfig = ClientConfig()):
+        super().__init__(base_url, client_config)
+        default_client = self.client
+        self.client = httpx.AsyncClient(
+            headers=default_client.headers,
+            timeout=default_client.timeout,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+        )
+        # Default client from the SDK is never used; closed alongside ours.
+        self._default_client = default_client
+
+    async def close(self):
+        await self.client.aclose()
+        await self._default_client.aclose()
+
+
+@dataclass(slots=True, frozen=True)
 class RaceState:
-    """Minimal race state used by the bot"""
+    """Minimal race state used by the bot (slotted: many live per tick)"""
     race_id: int
     race_started: bool
     race_finished: bool
@@ -73,34 +147,113 @@ class EquinoxRaceBot:
         """
         self.private_key = private_key
         self.contract_address = contract_address
+        # Precomputed once; these strings are rebuilt on every RPC otherwise
+        self._module = f"{contract_address}::{MODULE_NAME}"
+        self._fns = {
+            name: f"{self._module}::{name}"
+            for name in (
+                "get_active_races",
+                "get_race_state",
+                "get_race_states_bulk",
+                "get_active_races_with_state",
+            )
+        }
         api_key = os.getenv("APTOS_API_KEY") or os.getenv("NEXT_PUBLIC_APTOS_API_KEY")
         client_config = ClientConfig(api_key=api_key)
-        self.client = RestClient(NODE_URL, client_config)
+        self.client = PooledRestClient(NODE_URL, client_config)
         self.account = Account.load_key(private_key)
-        self.last_advance_time: Dict[int, float] = {}
-        self._tx_lock = asyncio.Lock()
+        # Cooldowns live in a flat float array indexed through a compact
+        # race_id -> index map so a whole tick's worth of races can be
+        # filtered with one vectorized compare
+        self._id_to_ix: Dict[int, int] = {}
+        self._cooldowns = np.zeros(256, dtype=np.float64) if np is not None else [0.0] * 256
+        # Locally allocated sequence numbers let concurrent submissions
+        # pipeline instead of serializing behind a global tx lock
+        self._seq_lock = asyncio.Lock()
+        self._next_seq: Optional[int] = None
+        # Short-TTL view caches so quiet ticks don't pay redundant RPC hits.
+        # Both are invalidated whenever we submit a state-changing transaction.
+        self._active_races_cache: Optional[Tuple[float, List[int]]] = None
+        self._race_state_cache: Dict[int, Tuple[float, RaceState]] = {}
+        # Bounds concurrent per-race view calls on the fallback path
+        self._rpc_sem = asyncio.Semaphore(16)
+        # Hard cap on in-flight race processing regardless of how work is
+        # dispatched; keeps fan-out under the HTTP pool's 100-connection cap
+        self._race_sem = asyncio.Semaphore(32)
+        # Set by wake() to short-circuit the inter-tick sleep
+        self._wake = asyncio.Event()
+        # Reuses serialized entry payloads across repeated advances; bounded
+        # FIFO so long-running bots don't accumulate finished race ids
+        self._payload_cache: "OrderedDict[Tuple[int, str], TransactionPayload]" = OrderedDict()
+        # Submitted-but-unconfirmed txs handed to the background confirmer
+        self._pending_confirms: "asyncio.Queue[Tuple[str, str, Tuple[int, ...]]]" = asyncio.Queue()
+        self._confirmer_task: Optional[asyncio.Task] = None
+        # Races are sharded by race_id across independent worker queues so
+        # one slow race can't stall the rest of the tick
+        self._work_queues: List["asyncio.Queue[Any]"] = []
+        self._worker_tasks: List[asyncio.Task] = []
+        self._work_done = False
 
         logger.info(f"Bot initialized with account: {self.account.address()}")
         logger.info(f"Contract address: {contract_address}")
         logger.info(f"Node URL: {NODE_URL}")
 
+    async def close(self):
+        """Stop background tasks and release the shared HTTP connection pool"""
+        background = list(self._worker_tasks)
+        if self._confirmer_task:
+            background.append(self._confirmer_task)
+        for task in background:
+            if not task.done():
+                task.cancel()
+        for task in background:
+            try:
+                await task
+            except (asyncio.CancelledError, Exception):
+                pass
+        self._worker_tasks = []
+        await self.client.close()
+
     def _fn(self, name: str) -> str:
-        return f"{self.contract_address}::{MODULE_NAME}::{name}"
+        cached = self._fns.get(name)
+        return cached if cached is not None else f"{self._module}::{name}"
 
     @staticmethod
     def _parse_option_u64(opt: Any) -> Optional[int]:
         """Parse Aptos Option<u64> JSON into Python int or None"""
+        if isinstance(opt, dict):
+            vec = opt.get('vec')
+            if vec:
+                return int(vec[0])
+        return None
+
+    async def _view_raw(self, function: str, type_args: List[str], args: List[Any],
+                        decoder: Any = None) -> Any:
+        """Call view with pre-normalized args and parse the JSON response.
+
+        When a msgspec decoder is given the raw bytes are decoded straight
+        into typed structs, skipping the generic list/dict representation.
+        """
         try:
-            if isinstance(opt, dict) and 'vec' in opt:
-                vec = opt.get('vec') or []
-                if isinstance(vec, list) and len(vec) > 0:
-                    return int(vec[0])
+            content = await self.client.view(function, type_args, args)
+            if not isinstance(content, (str, bytes, bytearray, memoryview)):
+                return content  # SDK already parsed the response
+            if decoder is not None:
+                return decoder.decode(content)
+            return _json_loads(content)
+        except ApiError as e:
+            if getattr(e, 'status_code', None) == 429:
+                logger.error(f"Rate limited on view {function}. Backing off...")
+                await asyncio.sleep(5)
+            else:
+                logger.error(f"View error {function}: {e}")
             return None
-        except Exception:
+        except Exception as e:
+            logger.error(f"Failed to parse view response for {function}: {e}")
             return None
 
     async def _view_json(self, function: str, type_args: List[str], args: List[Any]) -> Any:
-        """Helper to call view and parse JSON response"""
+        """Generic view helper that normalizes Python args to Aptos JSON"""
         norm_args: List[Any] = []
         for a in args:
             if isinstance(a, bool):
@@ -109,84 +262,196 @@ class EquinoxRaceBot:
                 norm_args.append(str(a))
             else:
                 norm_args.append(a)
-        try:
-            content = await self.client.view(function, type_args, norm_args)
-            return json.loads(content)
-        except ApiError as e:
-            if getattr(e, 'status_code', None) == 429:
-                logger.error(f"Rate limited on view {function}. Backing off...")
-                await asyncio.sleep(5)
-            else:
-                logger.error(f"View error {function}: {e}")
-            return None
-        except Exception as e:
-            logger.error(f"Failed to parse view response for {function}: {e}")
-            return None
+        return await self._view_raw(function, type_args, norm_args)
+
+    async def _view_noargs(self, function: str, decoder: Any = None) -> Any:
+        """Fast path for views with no arguments"""
+        return await self._view_raw(function, [], [], decoder=decoder)
+
+    async def _view_u64(self, function: str, value: int) -> Any:
+        """Fast path for views taking a single u64 argument"""
+        return await self._view_raw(function, [], [str(value)])
+
+    def invalidate_active_races(self):
+        """Drop the cached active race list (call after state-changing txs)"""
+        self._active_races_cache = None
+
+    def invalidate_race_state(self, race_id: int):
+        """Drop the cached state for a single race"""
+        self._race_state_cache.pop(race_id, None)
 
     async def get_active_races(self) -> List[int]:
-        """Fetch all active race IDs from the contract (v3)"""
+        """Fetch all active race IDs from the contract (v3, TTL-cached)"""
+        cached = self._active_races_cache
+        if cached and time.monotonic() - cached[0] < VIEW_CACHE_TTL:
+            return cached[1]
         try:
-            response = await self._view_json(self._fn("get_active_races"), [], [])
+            response = await self._view_noargs(
+                self._fns["get_active_races"], decoder=_ACTIVE_IDS_DECODER
+            )
             race_ids = response[0] if response else []
-            return [int(r) for r in race_ids]
+            races = [int(r) for r in race_ids]
+            self._active_races_cache = (time.monotonic(), races)
+            return races
         except Exception as e:
             logger.error(f"Error fetching active races: {e}")
             return []
 
     async def get_race_state(self, race_id: int) -> Optional[RaceState]:
-        """Fetch race state for a specific race ID (v3 tuple decoding)"""
+        """Fetch race state for a specific race ID (v3 tuple decoding, TTL-cached)"""
+        cached = self._race_state_cache.get(race_id)
+        if cached and time.monotonic() - cached[0] < VIEW_CACHE_TTL:
+            return cached[1]
         try:
-            response = await self._view_json(self._fn("get_race_state"), [], [race_id])
+            response = await self._view_u64(self._fns["get_race_state"], race_id)
 
             if not response or len(response) < 13:
                 logger.debug(f"Empty/invalid state for race {race_id}: {response}")
                 return None
 
-            (
-                _id,
-                creator,
-                race_type,
-                race_started,
-                race_finished,
-                current_round,
-                _horses,
-                entries,
-                _track,
-                _total_bet_pool,
-                _entry_fee_pool,
-                start_time_opt,
-                _betting_end_time_opt,
-            ) = response
-
-            start_time = self._parse_option_u64(start_time_opt)
-            entries_count = len(entries) if isinstance(entries, list) else 0
-
-            return RaceState(
+            # Index into the 13-tuple directly; only 7 of its fields are
+            # needed and positional access avoids throwaway name bindings
+            creator = response[1]
+            entries = response[7]
+
+            state = RaceState(
                 race_id=race_id,
-                race_started=bool(race_started),
-                race_finished=bool(race_finished),
-                race_type=int(race_type),
-                current_round=int(current_round),
-                entries_count=entries_count,
-                start_time=start_time,
+                race_started=bool(response[3]),
+                race_finished=bool(response[4]),
+                race_type=int(response[2]),
+                current_round=int(response[5]),
+                entries_count=len(entries) if isinstance(entries, list) else 0,
+                start_time=self._parse_option_u64(response[11]),
                 creator=str(creator) if creator is not None else None,
             )
+            self._race_state_cache[race_id] = (time.monotonic(), state)
+            return state
         except Exception as e:
             logger.error(f"Error fetching race state for race {race_id}: {e}")
             return None
 
+    def _race_state_from_view(self, race_id: int, view: Dict[str, Any]) -> RaceState:
+        """Build a RaceState from a RaceStateView JSON object (bulk view)"""
+        entries = view.get('entries')
+        return RaceState(
+            race_id=race_id,
+            race_started=bool(view.get('race_started')),
+            race_finished=bool(view.get('race_finished')),
+            race_type=int(view.get('race_type', 0)),
+            current_round=int(view.get('current_round', 0)),
+            entries_count=len(entries) if isinstance(entries, list) else 0,
+            start_time=self._parse_option_u64(view.get('start_time')),
+            creator=str(view['creator']) if view.get('creator') is not None else None,
+        )
+
+    def _build_race_state(self, view: Any) -> RaceState:
+        """Build a RaceState from either a typed struct or a plain dict"""
+        if isinstance(view, dict):
+            return self._race_state_from_view(int(view['race_id']), view)
+        vec = view.start_time.vec
+        return RaceState(
+            race_id=int(view.race_id),
+            race_started=view.race_started,
+            race_finished=view.race_finished,
+            race_type=view.race_type,
+            current_round=int(view.current_round),
+            entries_count=len(view.entries),
+            start_time=int(vec[0]) if vec else None,
+            creator=view.creator,
+        )
+
+    async def get_race_states(self, race_ids: List[int]) -> List[RaceState]:
+        """Fetch state for many races in one get_race_states_bulk view call"""
+        if not race_ids:
+            return []
+        try:
+            response = await self._view_raw(
+                self._fns["get_race_states_bulk"], [], [[str(r) for r in race_ids]],
+                decoder=_STATES_DECODER,
+            )
+            views = response[0] if response else []
+            now = time.monotonic()
+            states = []
+            for view in views:
+                state = self._build_race_state(view)
+                self._race_state_cache[state.race_id] = (now, state)
+                states.append(state)
+            return states
+        except Exception as e:
+            logger.error(f"Error fetching bulk race states: {e}")
+            return []
+
+    async def get_active_race_states(self) -> Optional[List[RaceState]]:
+        """Fetch active race ids and their states in one fused view call.
+
+        Returns None when the fused view is unavailable so callers can fall
+        back to the list + bulk-state pair of calls.
+        """
+        response = await self._view_noargs(
+            self._fns["get_active_races_with_state"], decoder=_STATES_DECODER
+        )
+        if response is None:
+            return None
+        views = response[0] if response else []
+        now = time.monotonic()
+        states = []
+        for view in views:
+            state = self._build_race_state(view)
+            self._race_state_cache[state.race_id] = (now, state)
+            states.append(state)
+        self._active_races_cache = (now, [s.race_id for s in states])
+        return states
+
+    def _cooldown_ix(self, race_id: int) -> int:
+        """Map a race id onto its slot in the cooldown array, growing it
+        (doubling) when new races outpace the current capacity"""
+        ix = self._id_to_ix.get(race_id)
+        if ix is None:
+            ix = len(self._id_to_ix)
+            self._id_to_ix[race_id] = ix
+            if ix >= len(self._cooldowns):
+                if np is not None:
+                    self._cooldowns = np.concatenate(
+                        [self._cooldowns, np.zeros(len(self._cooldowns), dtype=np.float64)]
+                    )
+                else:
+                    self._cooldowns = self._cooldowns + [0.0] * len(self._cooldowns)
+        return ix
+
+    def _set_cooldown(self, race_id: int):
+        self._cooldowns[self._cooldown_ix(race_id)] = time.monotonic()
+
+    def _clear_cooldown(self, race_id: int):
+        self._cooldowns[self._cooldown_ix(race_id)] = 0.0
+
     def should_advance_race(self, race_state: RaceState) -> bool:
         """Determine if a race should be advanced"""
         if not race_state.race_started or race_state.race_finished:
             return False
 
-        # Cooldown to prevent spamming the function
-        last_advance = self.last_advance_time.get(race_state.race_id, 0)
-        if time.time() - last_advance < RACE_ADVANCE_COOLDOWN:
+        # Cooldown to prevent spamming the function (monotonic: immune to
+        # wall-clock jumps from NTP adjustments)
+        last_advance = self._cooldowns[self._cooldown_ix(race_state.race_id)]
+        if time.monotonic() - last_advance < RACE_ADVANCE_COOLDOWN:
             return False
 
         return True
 
+    def should_advance_many(self, states: List[RaceState]) -> List[bool]:
+        """Vectorized cooldown filter over a whole tick's states"""
+        if np is None or not states:
+            return [self.should_advance_race(s) for s in states]
+        ixs = np.fromiter(
+            (self._cooldown_ix(s.race_id) for s in states),
+            dtype=np.intp,
+            count=len(states),
+        )
+        off_cooldown = (time.monotonic() - self._cooldowns[ixs]) >= RACE_ADVANCE_COOLDOWN
+        return [
+            s.race_started and not s.race_finished and bool(off_cooldown[i])
+            for i, s in enumerate(states)
+        ]
+
     def can_execute_quick_race(self, race_state: RaceState) -> bool:
         """Check if a quick race can be auto-executed (time in microseconds)"""
         if race_state.race_type != 1:  # QUICK
@@ -198,23 +463,87 @@ class EquinoxRaceBot:
         current_time_us = int(time.time() * 1_000_000)
         return current_time_us >= race_state.start_time
 
-    async def advance_race(self, race_id: int) -> bool:
-        """Advance a race by one round"""
+    async def _next_sequence_number(self) -> int:
+        """Allocate the next account sequence number, fetching once lazily"""
+        async with self._seq_lock:
+            if self._next_seq is None:
+                self._next_seq = await self.client.account_sequence_number(self.account.address())
+            seq = self._next_seq
+            self._next_seq += 1
+            return seq
+
+    def _reset_sequence_number(self):
+        """Force a resync from the chain on the next allocation"""
+        self._next_seq = None
+
+    async def _submit_payload(self, payload: TransactionPayload) -> str:
+        """Sign with a pipelined sequence number and submit; returns tx hash"""
+        seq = await self._next_sequence_number()
         try:
+            signed = await self.client.create_bcs_signed_transaction(
+                self.account, payload, sequence_number=seq
+            )
+            return await self.client.submit_bcs_transaction(signed)
+        except Exception:
+            # A failed submit can leave the local counter out of step with
+            # the chain (e.g. SEQUENCE_NUMBER_TOO_OLD); resync on next use.
+            self._reset_sequence_number()
+            raise
+
+    def _entry_payload_u64(self, name: str, race_id: int) -> TransactionPayload:
+        """Build (or reuse) the payload for an entry taking a single race id"""
+        key = (race_id, name)
+        payload = self._payload_cache.get(key)
+        if payload is None:
             payload = TransactionPayload(
                 EntryFunction.natural(
-                    f"{self.contract_address}::{MODULE_NAME}",
-                    "advance_race",
+                    self._module,
+                    name,
                     [],
                     [TransactionArgument(int(race_id), bcs.Serializer.u64)],
                 )
             )
+            if len(self._payload_cache) >= PAYLOAD_CACHE_MAX:
+                self._payload_cache.popitem(last=False)
+            self._payload_cache[key] = payload
+        return payload
+
+    def _ensure_confirmer(self):
+        """Start the background confirmation task if it isn't running"""
+        if self._confirmer_task is None or self._confirmer_task.done():
+            self._confirmer_task = asyncio.create_task(self._confirmer())
+
+    async def _confirmer(self):
+        """Confirm submitted transactions off the hot path.
+
+        On a failed confirmation the affected races' cooldowns and cached
+        state are rolled back so the next tick retries them.
+        """
+        while True:
+            txn_hash, label, race_ids = await self._pending_confirms.get()
+            try:
+                await self.client.wait_for_transaction(txn_hash)
+                logger.debug(f"Confirmed {label} tx {txn_hash}")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Transaction {txn_hash} ({label}) failed to confirm: {e}")
+                for race_id in race_ids:
+                    self._clear_cooldown(race_id)
+                    self.invalidate_race_state(race_id)
+                self.invalidate_active_races()
+
+    async def advance_race(self, race_id: int) -> bool:
+        """Advance a race by one round"""
+        try:
+            payload = self._entry_payload_u64("advance_race", race_id)
 
-            async with self._tx_lock:
-                signed = await self.client.create_bcs_signed_transaction(self.account, payload)
-                await self.client.submit_and_wait_for_bcs_transaction(signed)
+            txn_hash = await self._submit_payload(payload)
+            self._pending_confirms.put_nowait((txn_hash, "advance_race", (race_id,)))
 
-            self.last_advance_time[race_id] = time.time()
+            self._set_cooldown(race_id)
+            self.invalidate_race_state(race_id)
+            self.invalidate_active_races()
             logger.info(f"Successfully advanced race {race_id}")
             return True
 
@@ -226,22 +555,53 @@ class EquinoxRaceBot:
                 logger.error(f"Error advancing race {race_id}: {e}")
             return False
 
-    async def execute_quick_race(self, race_id: int) -> bool:
-        """Execute a quick race that's ready to start"""
+    async def advance_races(self, race_ids: List[int]) -> bool:
+        """Advance several races in one batched transaction"""
+        if not race_ids:
+            return True
         try:
             payload = TransactionPayload(
                 EntryFunction.natural(
-                    f"{self.contract_address}::{MODULE_NAME}",
-                    "execute_quick_race",
+                    self._module,
+                    "advance_races",
                     [],
-                    [TransactionArgument(int(race_id), bcs.Serializer.u64)],
+                    [
+                        TransactionArgument(
+                            [int(r) for r in race_ids],
+                            bcs.Serializer.sequence_serializer(bcs.Serializer.u64),
+                        )
+                    ],
                 )
             )
 
-            async with self._tx_lock:
-                signed = await self.client.create_bcs_signed_transaction(self.account, payload)
-                await self.client.submit_and_wait_for_bcs_transaction(signed)
+            txn_hash = await self._submit_payload(payload)
+            self._pending_confirms.put_nowait((txn_hash, "advance_races", tuple(race_ids)))
+
+            for race_id in race_ids:
+                self._set_cooldown(race_id)
+                self.invalidate_race_state(race_id)
+            self.invalidate_active_races()
+            logger.info(f"Successfully advanced races {race_ids}")
+            return True
+
+        except Exception as e:
+            if isinstance(e, ApiError) and getattr(e, 'status_code', None) == 429:
+                logger.error(f"Rate limited while advancing races {race_ids}. Backing off...")
+                await asyncio.sleep(5)
+            else:
+                logger.error(f"Error advancing races {race_ids}: {e}")
+            return False
+
+    async def execute_quick_race(self, race_id: int) -> bool:
+        """Execute a quick race that's ready to start"""
+        try:
+            payload = self._entry_payload_u64("execute_quick_race", race_id)
+
+            txn_hash = await self._submit_payload(payload)
+            self._pending_confirms.put_nowait((txn_hash, "execute_quick_race", (race_id,)))
 
+            self.invalidate_race_state(race_id)
+            self.invalidate_active_races()
             logger.info(f"Successfully executed quick race {race_id}")
             return True
 
@@ -253,57 +613,163 @@ class EquinoxRaceBot:
                 logger.error(f"Error executing quick race {race_id}: {e}")
             return False
 
-    async def process_race(self, race_id: int):
-        """Process a single race - advance or execute as needed"""
-        race_state = await self.get_race_state(race_id)
+    async def process_race(self, race_id: int) -> bool:
+        """Process a single race - fetch state then advance or execute"""
+        async with self._rpc_sem:
+            race_state = await self.get_race_state(race_id)
         if not race_state:
+            return False
+        return await self.process_race_with_state(race_state)
+
+    async def process_race_with_state(self, race_state: RaceState) -> bool:
+        """Process a single race from already-fetched state.
+
+        Returns True when a transaction was successfully submitted.
+        """
+        async with self._race_sem:
+            # Check if we should advance an ongoing race
+            if self.should_advance_race(race_state):
+                success = await self.advance_race(race_state.race_id)
+                if success:
+                    logger.info(f"Advanced race {race_state.race_id} to round {race_state.current_round + 1}")
+                return success
+
+            # Check if we should execute a quick race
+            elif self.can_execute_quick_race(race_state):
+                success = await self.execute_quick_race(race_state.race_id)
+                if success:
+                    logger.info(f"Executed quick race {race_state.race_id}")
+                return success
+
+            return False
+
+    def _ensure_workers(self):
+        """Start the race-processing worker pool if it isn't running"""
+        if self._worker_tasks:
             return
-        
-        # Check if we should advance an ongoing race
-        if self.should_advance_race(race_state):
-            success = await self.advance_race(race_id)
-            if success:
-                logger.info(f"Advanced race {race_id} to round {race_state.current_round + 1}")
-        
-        # Check if we should execute a quick race
-        elif self.can_execute_quick_race(race_state):
-            success = await self.execute_quick_race(race_id)
-            if success:
-                logger.info(f"Executed quick race {race_id}")
-    
-    async def monitor_races(self):
-        """Main monitoring loop"""
-        logger.info("Starting race monitoring...")
-        
-        while True:
-            try:
-                active_races = await self.get_active_races()
-                logger.debug(f"Monitoring {len(active_races)} active races")
-                
-                # Process each race
-                tasks = [self.process_race(race_id) for race_id in active_races]
-                await asyncio.gather(*tasks, return_exceptions=True)
-                
-                # Wait before next check
-                await asyncio.sleep(BOT_CHECK_INTERVAL)
-                
-            except Exception as e:
-                logger.error(f"Error in monitoring loop: {e}")
-                await asyncio.sleep(BOT_CHECK_INTERVAL)
-    
-    async def run(self):
-        """Start the bot"""
-        logger.info("Equinox Racing Bot starting...")
-        try:
-            await self.monitor_races()
-        except KeyboardInterrupt:
-            logger.info("Bot stopped by user")
-        except Exception as e:
-            logger.error(f"Bot crashed: {e}")
-            raise
-
+        self._work_queues = [asyncio.Queue() for _ in range(BOT_WORKERS)]
+        self._worker_tasks = [
+            asyncio.create_task(self._worker(i)) for i in range(BOT_WORKERS)
+        ]
+
+    def _dispatch_race(self, race_id: int, item: Any):
+        """Shard a race onto its worker queue (stable by race_id)"""
+        self._work_queues[race_id % BOT_WORKERS].put_nowait(item)
+
+    async def _worker(self, index: int):
+        """Drain one work queue; items are RaceStates or raw race ids"""
+        queue = self._work_queues[index]
+        while True:
+            item = await queue.get()
+            try:
+                if isinstance(item, RaceState):
+                    did_work = await self.process_race_with_state(item)
+                else:
+                    did_work = await self.process_race(item)
+                if did_work:
+                    self._work_done = True
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Worker {index} error: {e}")
+            finally:
+                queue.task_done()
+
+    def wake(self):
+        """Interrupt the inter-tick sleep (e.g. from an external event hook)"""
+        self._wake.set()
+
+    async def _sleep_until_wake(self, timeout: float) -> bool:
+        """Sleep up to timeout seconds; returns True if woken externally"""
+        try:
+            await asyncio.wait_for(self._wake.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return False
+        self._wake.clear()
+        return True
+
+    async def monitor_races(self):
+        """Main monitoring loop"""
+        logger.info("Starting race monitoring...")
+        self._ensure_confirmer()
+        self._ensure_workers()
+
+        sleep_s = float(BOT_CHECK_INTERVAL)
+        while True:
+            try:
+                work_done = False
+
+                # One fused view returns every active race with its state
+                states = await self.get_active_race_states()
+                if states is None:
+                    # Fused view unavailable (older deployment): list ids
+                    # then bulk-fetch their states
+                    active_races = await self.get_active_races()
+                    states = await self.get_race_states(active_races) or None
+                else:
+                    active_races = [s.race_id for s in states]
+                logger.debug(f"Monitoring {len(active_races)} active races")
+
+                if states:
+                    # Coalesce all due advances into a single batched tx
+                    advance_mask = self.should_advance_many(states)
+                    ids_to_advance = [
+                        s.race_id for s, due in zip(states, advance_mask) if due
+                    ]
+                    if ids_to_advance:
+                        work_done = await self.advance_races(ids_to_advance) or work_done
+                    advanced = set(ids_to_advance)
+                    for state in states:
+                        if state.race_id not in advanced:
+                            self._dispatch_race(state.race_id, state)
+                else:
+                    # Bulk view unavailable (older deployment): fall back to
+                    # per-race views bounded by _rpc_sem
+                    for race_id in active_races:
+                        self._dispatch_race(race_id, race_id)
+
+                # Wait for this tick's work to drain before deciding backoff
+                await asyncio.gather(*(q.join() for q in self._work_queues))
+                work_done = work_done or self._work_done
+                self._work_done = False
+
+                # Back off while idle, snap back to the base interval on work
+                if work_done:
+                    sleep_s = float(BOT_CHECK_INTERVAL)
+                else:
+                    sleep_s = min(sleep_s * 1.5, float(BOT_MAX_CHECK_INTERVAL))
+
+                if await self._sleep_until_wake(sleep_s):
+                    # External wake-up implies on-chain state changed
+                    self.invalidate_active_races()
+                    sleep_s = float(BOT_CHECK_INTERVAL)
+
+            except Exception as e:
+                logger.error(f"Error in monitoring loop: {e}")
+                await asyncio.sleep(BOT_CHECK_INTERVAL)
+    
+    async def run(self):
+        """Start the bot"""
+        logger.info("Equinox Racing Bot starting...")
+        try:
+            await self.monitor_races()
+        except KeyboardInterrupt:
+            logger.info("Bot stopped by user")
+        except Exception as e:
+            logger.error(f"Bot crashed: {e}")
+            raise
+        finally:
+            await self.close()
+
 def main():
     """Main entry point"""
+    # uvloop is a drop-in speedup for the RPC-heavy coroutines; optional
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     # Load configuration from environment variables
     private_key = os.getenv('BOT_PRIVATE_KEY')
     contract_address = os.getenv('CONTRACT_ADDRESS', CONTRACT_ADDRESS)
@@ -311,10 +777,10 @@ def main():
     if not private_key:
         logger.error("BOT_PRIVATE_KEY environment variable is required")
         return
-    
-    # Create and run bot
-    bot = EquinoxRaceBot(private_key, contract_address)
-    asyncio.run(bot.run())
-
-if __name__ == "__main__":
+    
+    # Create and run bot
+    bot = EquinoxRaceBot(private_key, contract_address)
+    asyncio.run(bot.run())
+
+if __name__ == "__main__":
     main()
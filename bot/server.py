@@ -7,6 +7,13 @@ from fastapi import FastAPI
 
 from equinox_race_bot import EquinoxRaceBot, CONTRACT_ADDRESS
 
+# Install uvloop before any event loop is created; optional speedup
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    uvloop = None
+
 logger = logging.getLogger(__name__)
 
 app = FastAPI(title="Equinox Racing Bot", version="1.0")
@@ -49,6 +56,8 @@ class BotRunner:
                 await self.task
             except asyncio.CancelledError:
                 logger.info("Bot background task cancelled.")
+        if self.bot:
+            await self.bot.close()
 
 
 runner = BotRunner()
@@ -64,6 +73,15 @@ async def on_shutdown():
     await runner.stop()
 
 
+@app.post("/wake")
+async def wake():
+    """Short-circuit the bot's inter-tick sleep (e.g. from an indexer webhook)"""
+    if runner.bot:
+        runner.bot.wake()
+        return {"ok": True}
+    return {"ok": False, "reason": "bot not running"}
+
+
 @app.get("/health")
 async def health():
     return {
@@ -72,3 +90,14 @@ async def health():
         "contract_address": os.getenv("CONTRACT_ADDRESS", CONTRACT_ADDRESS),
     }
 
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run(
+        app,
+        host=os.getenv("HOST", "0.0.0.0"),
+        port=int(os.getenv("PORT", "8000")),
+        loop="uvloop" if uvloop else "asyncio",
+    )
+
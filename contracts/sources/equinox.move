@@ -95,6 +95,22 @@ module equinox_addr::equinox_v3 {
         finish_time: u64,
     }
 
+    struct RaceStateView has store, drop, copy {
+        race_id: u64,
+        creator: address,
+        race_type: u8,
+        race_started: bool,
+        race_finished: bool,
+        current_round: u64,
+        horses: vector<Horse>,
+        entries: vector<RaceEntry>,
+        track: RaceTrack,
+        total_bet_pool: u64,
+        entry_fee_pool: u64,
+        start_time: Option<u64>,
+        betting_end_time: Option<u64>,
+    }
+
     struct GlobalGameManager has key {
         next_race_id: u64,
         total_horses_minted: u64,
@@ -498,6 +514,34 @@ module equinox_addr::equinox_v3 {
 
     #[randomness]
     entry fun advance_race(_player: &signer, race_id: u64) acquires GlobalGameManager {
+        advance_race_internal(race_id);
+    }
+
+    #[randomness]
+    entry fun advance_races(_player: &signer, race_ids: vector<u64>) acquires GlobalGameManager {
+        let i = 0;
+        let len = vector::length(&race_ids);
+        while (i < len) {
+            let race_id = *vector::borrow(&race_ids, i);
+            // Skip races that finished (or were removed) since the caller
+            // listed them, so one stale id cannot abort the whole batch
+            if (is_race_advanceable(race_id)) {
+                advance_race_internal(race_id);
+            };
+            i = i + 1;
+        };
+    }
+
+    fun is_race_advanceable(race_id: u64): bool acquires GlobalGameManager {
+        let game_manager = borrow_global<GlobalGameManager>(@equinox_addr);
+        if (!race_exists(game_manager, race_id)) {
+            return false
+        };
+        let race = find_race(game_manager, race_id);
+        race.race_started && !race.race_finished
+    }
+
+    fun advance_race_internal(race_id: u64) acquires GlobalGameManager {
         {
             let game_manager = borrow_global_mut<GlobalGameManager>(@equinox_addr);
             let race = find_race_mut(game_manager, race_id);
@@ -919,6 +963,68 @@ module equinox_addr::equinox_v3 {
         )
     }
 
+    fun race_state_view(race: &Race): RaceStateView {
+        RaceStateView {
+            race_id: race.race_id,
+            creator: race.creator,
+            race_type: race.race_type,
+            race_started: race.race_started,
+            race_finished: race.race_finished,
+            current_round: race.current_round,
+            horses: race.horses,
+            entries: race.entries,
+            track: race.track,
+            total_bet_pool: race.total_bet_pool,
+            entry_fee_pool: race.entry_fee_pool,
+            start_time: race.start_time,
+            betting_end_time: race.betting_end_time,
+        }
+    }
+
+    fun race_exists(game_manager: &GlobalGameManager, race_id: u64): bool {
+        let i = 0;
+        let len = vector::length(&game_manager.race_storage);
+        while (i < len) {
+            let race = vector::borrow(&game_manager.race_storage, i);
+            if (race.race_id == race_id) {
+                return true
+            };
+            i = i + 1;
+        };
+        false
+    }
+
+    #[view]
+    public fun get_race_states_bulk(race_ids: vector<u64>): vector<RaceStateView> acquires GlobalGameManager {
+        let game_manager = borrow_global<GlobalGameManager>(@equinox_addr);
+        let states = vector::empty<RaceStateView>();
+        let i = 0;
+        let len = vector::length(&race_ids);
+        while (i < len) {
+            let race_id = *vector::borrow(&race_ids, i);
+            // Skip ids that finished between the caller's listing and this call
+            if (race_exists(game_manager, race_id)) {
+                vector::push_back(&mut states, race_state_view(find_race(game_manager, race_id)));
+            };
+            i = i + 1;
+        };
+        states
+    }
+
+    #[view]
+    public fun get_active_races_with_state(): vector<RaceStateView> acquires GlobalGameManager {
+        let game_manager = borrow_global<GlobalGameManager>(@equinox_addr);
+        let states = vector::empty<RaceStateView>();
+        let i = 0;
+        let len = vector::length(&game_manager.active_races);
+        while (i < len) {
+            let race_id = *vector::borrow(&game_manager.active_races, i);
+            vector::push_back(&mut states, race_state_view(find_race(game_manager, race_id)));
+            i = i + 1;
+        };
+        states
+    }
+
     #[view]
     public fun get_race_bets(race_id: u64): vector<Bet> acquires GlobalGameManager {
         let game_manager = borrow_global<GlobalGameManager>(@equinox_addr);